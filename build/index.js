@@ -1,7 +1,6 @@
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js";
 import fs from 'fs';
-import { glob } from 'glob';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { z } from "zod";
@@ -16,19 +15,17 @@ const SERVER_PORT = parseInt(process.env.PORT || DEFAULT_PORT.toString(), 10);
 const BASE_DIR = path.resolve(__dirname, '..');
 const RESOURCES_DIR = path.join(BASE_DIR, "resources");
 const CODE_EXAMPLES_DIR = path.join(RESOURCES_DIR, "code-examples");
+// File extensions that count as code examples
+const CODE_EXTENSIONS = ['.js', '.jsx', '.ts', '.tsx'];
 // HTTP Transport class for direct JSON-RPC over HTTP
 class HTTPTransport {
     _response = null;
-    _request = null;
     onclose;
     onerror;
     onmessage;
     setResponse(res) {
         this._response = res;
     }
-    setRequest(req) {
-        this._request = req;
-    }
     async start() {
         // For HTTP transport, start is handled when the request comes in
         logDebug('HTTPTransport started');
@@ -36,14 +33,21 @@ class HTTPTransport {
     async send(message) {
         if (this._response && !this._response.headersSent) {
             try {
-                logDebug('Sending HTTP response:', JSON.stringify(message));
+                // Serialize once and reuse for both logging and the response body
+                const json = JSON.stringify(message);
+                logDebug('Sending HTTP response:', json);
+                // Encode up front so the byte length is known: with an explicit
+                // Content-Length the response goes out in a single write instead
+                // of falling back to chunked transfer encoding
+                const payload = Buffer.from(json, 'utf8');
                 this._response.writeHead(200, {
                     'Content-Type': 'application/json',
+                    'Content-Length': payload.byteLength,
                     'Access-Control-Allow-Origin': '*',
                     'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
                     'Access-Control-Allow-Headers': 'Content-Type'
                 });
-                this._response.end(JSON.stringify(message));
+                this._response.end(payload);
             }
             catch (error) {
                 logError('Error sending HTTP response:', error);
@@ -58,7 +62,6 @@ class HTTPTransport {
             this._response.end();
         }
         this._response = null;
-        this._request = null;
         if (this.onclose) {
             this.onclose();
         }
@@ -81,46 +84,74 @@ function logInfo(message, ...args) {
 function logError(message, error) {
     console.error(`[ERROR] ${message}`, error);
 }
+// Resolved once at startup: process.env property reads go through a C++
+// accessor and are too slow for a check on every hot-path log call
+const DEBUG_ENABLED = !!process.env.DEBUG;
 function logDebug(message, ...args) {
-    if (process.env.DEBUG) {
+    if (DEBUG_ENABLED) {
         console.error(`[DEBUG] ${message}`, ...args);
     }
 }
+// Cached file reader keyed by path, invalidated by mtime.
+// Standards and examples are small, hot files that LLM clients request
+// repeatedly; serving them from memory avoids re-reading on every call.
+const FILE_CACHE_MAX_ENTRIES = 256;
+const fileCache = new Map();
+function readFileCached(filePath) {
+    const mtimeMs = fs.statSync(filePath).mtimeMs;
+    const cached = fileCache.get(filePath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+        return cached.content;
+    }
+    const content = fs.readFileSync(filePath, 'utf8');
+    if (fileCache.size >= FILE_CACHE_MAX_ENTRIES && !fileCache.has(filePath)) {
+        // Evict the oldest entry to bound memory use
+        const oldestKey = fileCache.keys().next().value;
+        if (oldestKey !== undefined) {
+            fileCache.delete(oldestKey);
+        }
+    }
+    fileCache.set(filePath, { mtimeMs, content });
+    return content;
+}
 // Helper function to get standard content with enhanced error handling
 function getStandardContent(category, standardId) {
+    const standardPath = path.join(RESOURCES_DIR, category, `${standardId}.md`);
+    logDebug(`Looking for standard at: ${standardPath}`);
+    // Read directly and treat a missing file as not-found rather than
+    // stat-ing first; one syscall instead of two and no check/read race
     try {
-        const standardPath = path.join(RESOURCES_DIR, category, `${standardId}.md`);
-        logDebug(`Looking for standard at: ${standardPath}`);
-        if (!fs.existsSync(standardPath)) {
-            logError(`Standard file not found: ${standardPath}`);
-            return { error: `Standard ${standardId} not found` };
-        }
-        const content = fs.readFileSync(standardPath, 'utf8');
+        const content = readFileCached(standardPath);
         logDebug(`Successfully read standard ${standardId}, length: ${content.length}`);
         return { content };
     }
     catch (err) {
+        if (err.code === 'ENOENT') {
+            logError(`Standard file not found: ${standardPath}`);
+            return { error: `Standard ${standardId} not found` };
+        }
         logError(`Error reading standard ${standardId}:`, err);
         return { error: `Error reading standard ${standardId}: ${err}` };
     }
 }
 // Helper function to find file in subdirectories with enhanced logging
-function findFileInSubdirectories(baseDir, fileName, extensions = ['.js', '.jsx', '.ts', '.tsx']) {
+function findFileInSubdirectories(baseDir, fileName, extensions = CODE_EXTENSIONS) {
     try {
         logDebug(`Searching for ${fileName} in ${baseDir}`);
-        // First, try with exact filename match
-        let files = glob.sync(`${baseDir}/**/${fileName}`);
-        if (files.length > 0) {
-            logDebug(`Found exact match: ${files[0]}`);
-            return files[0];
-        }
-        // Then try with file name + extensions
-        for (const ext of extensions) {
-            const fileWithExt = `${fileName}${ext}`;
-            files = glob.sync(`${baseDir}/**/${fileWithExt}`);
-            if (files.length > 0) {
-                logDebug(`Found with extension ${ext}: ${files[0]}`);
-                return files[0];
+        // Check the exact name and all extension variants in a single traversal
+        const candidates = new Set([fileName, ...extensions.map(ext => `${fileName}${ext}`)]);
+        const stack = [baseDir];
+        while (stack.length > 0) {
+            const dir = stack.pop();
+            for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+                const entryPath = path.join(dir, entry.name);
+                if (entry.isFile() && candidates.has(entry.name)) {
+                    logDebug(`Found match: ${entryPath}`);
+                    return entryPath;
+                }
+                else if (entry.isDirectory()) {
+                    stack.push(entryPath);
+                }
             }
         }
         logDebug(`No file found for ${fileName}`);
@@ -131,48 +162,208 @@ function findFileInSubdirectories(baseDir, fileName, extensions = ['.js', '.jsx'
         return null;
     }
 }
+// Precomputed example index: category dir -> lowercased name -> entry.
+// Each category is scanned once on first use so lookups become dict hits
+// instead of re-globbing the filesystem on every request.
+const exampleIndex = {};
+function buildCategoryIndex(categoryDir) {
+    const index = {};
+    const baseDir = path.join(CODE_EXAMPLES_DIR, "react-native", categoryDir);
+    if (!fs.existsSync(baseDir)) {
+        logError(`Directory does not exist: ${baseDir}`);
+        return index;
+    }
+    // Breadth-first over sorted entries with first-wins inserts, so when
+    // two files share a stem the shallowest (then alphabetically first)
+    // path is served regardless of filesystem readdir order
+    const queue = [baseDir];
+    while (queue.length > 0) {
+        const dir = queue.shift();
+        let entries;
+        try {
+            entries = fs.readdirSync(dir, { withFileTypes: true });
+        }
+        catch (err) {
+            logError(`Error scanning directory ${dir}:`, err);
+            continue;
+        }
+        // Compare code units rather than localeCompare so the order (and
+        // therefore which duplicate wins) does not depend on the host locale
+        entries.sort((a, b) => a.name < b.name ? -1 : a.name > b.name ? 1 : 0);
+        for (const entry of entries) {
+            const entryPath = path.join(dir, entry.name);
+            if (entry.isDirectory()) {
+                queue.push(entryPath);
+            }
+            else if (entry.isFile()) {
+                const ext = CODE_EXTENSIONS.find(e => entry.name.endsWith(e));
+                if (ext) {
+                    // The matched suffix is known, so strip it with one slice
+                    const name = entry.name.slice(0, -ext.length);
+                    const key = name.toLowerCase();
+                    if (!(key in index)) {
+                        index[key] = { name, path: entryPath };
+                    }
+                }
+            }
+        }
+    }
+    return index;
+}
+// How often to re-stat a category directory for changes. One stat per
+// category per interval is far cheaper than rescanning the tree, and a
+// directory's mtime changes whenever files are added or removed (moves
+// inside an existing subdirectory only bump that subdirectory's mtime,
+// which is an accepted limitation of this check).
+const INDEX_REFRESH_INTERVAL_MS = 5000;
+const indexMtimes = {};
+const indexLastCheck = {};
+function getExampleIndex(categoryDir) {
+    let index = exampleIndex[categoryDir];
+    const now = Date.now();
+    if (index && now - (indexLastCheck[categoryDir] ?? 0) >= INDEX_REFRESH_INTERVAL_MS) {
+        indexLastCheck[categoryDir] = now;
+        try {
+            const mtimeMs = fs.statSync(path.join(CODE_EXAMPLES_DIR, "react-native", categoryDir)).mtimeMs;
+            if (mtimeMs !== indexMtimes[categoryDir]) {
+                logDebug(`Example directory changed, rebuilding index for ${categoryDir}`);
+                index = undefined;
+                indexMtimes[categoryDir] = mtimeMs;
+            }
+        }
+        catch (err) {
+            logError(`Error checking example directory for ${categoryDir}:`, err);
+        }
+    }
+    if (!index) {
+        logDebug(`Building example index for ${categoryDir}`);
+        index = buildCategoryIndex(categoryDir);
+        exampleIndex[categoryDir] = index;
+        if (indexMtimes[categoryDir] === undefined) {
+            try {
+                indexMtimes[categoryDir] = fs.statSync(path.join(CODE_EXAMPLES_DIR, "react-native", categoryDir)).mtimeMs;
+            }
+            catch {
+                // Missing directory: buildCategoryIndex already logged it
+            }
+        }
+    }
+    return index;
+}
 // Helper function to get example content with enhanced error handling
 function getExampleContent(subcategory, filename) {
     try {
         const searchDir = path.join(CODE_EXAMPLES_DIR, "react-native", subcategory);
         logDebug(`Getting example content from ${searchDir} for ${filename}`);
-        const filePath = findFileInSubdirectories(searchDir, filename);
-        if (!filePath || !fs.existsSync(filePath)) {
+        const entry = getExampleIndex(subcategory)[filename.toLowerCase()];
+        const filePath = entry ? entry.path : findFileInSubdirectories(searchDir, filename);
+        if (!filePath) {
             logError(`Example file not found: ${filename} in ${subcategory}`);
             return { error: `Example ${filename} not found in ${subcategory}` };
         }
-        const content = fs.readFileSync(filePath, 'utf8');
+        const content = readFileCached(filePath);
         const relativePath = path.relative(BASE_DIR, filePath);
         logDebug(`Successfully read example ${filename}, length: ${content.length}`);
         return {
-            content: [content],
+            content,
             path: relativePath
         };
     }
     catch (err) {
+        // A stale index entry can point at a deleted file; report it the
+        // same as a miss instead of pre-checking existence on every read
+        if (err.code === 'ENOENT') {
+            logError(`Example file not found: ${filename} in ${subcategory}`);
+            return { error: `Example ${filename} not found in ${subcategory}` };
+        }
         logError(`Error reading example ${filename}:`, err);
         return { error: `Error reading example ${filename}: ${err}` };
     }
 }
+// Minimum similarity (0-100) for a scored fuzzy match to count
+const FUZZY_SCORE_CUTOFF = 70;
+// Levenshtein distance bounded by maxDistance. Only the diagonal band of
+// width 2 * maxDistance + 1 can hold values within the bound, so cells
+// outside it are skipped, and the scan bails out as soon as a whole row
+// exceeds the bound. Returns maxDistance + 1 when the true distance is
+// larger.
+function boundedLevenshteinDistance(a, b, maxDistance) {
+    const overflow = maxDistance + 1;
+    if (Math.abs(a.length - b.length) > maxDistance)
+        return overflow;
+    if (a.length === 0)
+        return b.length;
+    if (b.length === 0)
+        return a.length;
+    const row = new Array(b.length + 1);
+    for (let j = 0; j <= b.length; j++) {
+        row[j] = j <= maxDistance ? j : overflow;
+    }
+    for (let i = 1; i <= a.length; i++) {
+        const from = Math.max(1, i - maxDistance);
+        const to = Math.min(b.length, i + maxDistance);
+        let diagonal = row[from - 1];
+        row[from - 1] = from === 1 ? i : overflow;
+        let rowMin = row[from - 1];
+        for (let j = from; j <= to; j++) {
+            // Cells outside the previous row's band are known to exceed the
+            // bound, so overflow stands in for their exact value
+            const above = j > i - 1 + maxDistance ? overflow : row[j];
+            const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+            const value = Math.min(above + 1, row[j - 1] + 1, diagonal + cost, overflow);
+            diagonal = above;
+            row[j] = value;
+            if (value < rowMin) {
+                rowMin = value;
+            }
+        }
+        if (rowMin > maxDistance) {
+            return overflow;
+        }
+    }
+    return Math.min(row[b.length], overflow);
+}
+// Normalized similarity between two strings, 100 meaning identical.
+// Distances past the cutoff cannot matter, so the DP is bounded by the
+// largest distance that could still score at or above it.
+function similarityScore(a, b) {
+    const maxLength = Math.max(a.length, b.length);
+    if (maxLength === 0) {
+        return 100;
+    }
+    const maxDistance = Math.floor(maxLength * (1 - FUZZY_SCORE_CUTOFF / 100));
+    return (1 - boundedLevenshteinDistance(a, b, maxDistance) / maxLength) * 100;
+}
 // Find closest match implementation with enhanced error handling
-function findClosestMatch(directory, searchName, extensions = ['.js', '.jsx', '.ts', '.tsx']) {
+function findClosestMatch(categoryDir, searchName) {
     try {
-        if (!fs.existsSync(directory)) {
-            logError(`Directory does not exist: ${directory}`);
-            return null;
+        logDebug(`Finding closest match for ${searchName} in ${categoryDir}`);
+        // Index keys are already lowercased, so the only per-call lowering
+        // is on the query itself
+        const needle = searchName.toLowerCase();
+        const entries = Object.entries(getExampleIndex(categoryDir));
+        // Substring matches keep their previous priority
+        for (const [nameLower, entry] of entries) {
+            if (nameLower.includes(needle)) {
+                logDebug(`Found closest match: ${entry.name} for ${searchName}`);
+                return entry.name;
+            }
         }
-        logDebug(`Finding closest match for ${searchName} in ${directory}`);
-        for (const ext of extensions) {
-            const files = glob.sync(`${directory}/**/*${ext}`);
-            for (const filePath of files) {
-                const fileName = path.basename(filePath);
-                const fileNameNoExt = path.basename(fileName, path.extname(fileName));
-                if (fileNameNoExt.toLowerCase().includes(searchName.toLowerCase())) {
-                    logDebug(`Found closest match: ${fileNameNoExt} for ${searchName}`);
-                    return fileNameNoExt;
-                }
+        // Otherwise score every candidate so typos like 'buttom' still
+        // resolve to 'Button'
+        let bestName = null;
+        let bestScore = FUZZY_SCORE_CUTOFF;
+        for (const [nameLower, entry] of entries) {
+            const score = similarityScore(needle, nameLower);
+            if (score >= bestScore) {
+                bestScore = score;
+                bestName = entry.name;
             }
         }
+        if (bestName) {
+            logDebug(`Found closest match: ${bestName} for ${searchName} (score ${bestScore.toFixed(0)})`);
+            return bestName;
+        }
         logDebug(`No closest match found for ${searchName}`);
         return null;
     }
@@ -181,6 +372,16 @@ function findClosestMatch(directory, searchName, extensions = ['.js', '.jsx', '.
         return null;
     }
 }
+// Display titles for the example categories; the set of names is
+// closed, so the capitalized forms are spelled out once instead of
+// being rebuilt per request
+const CATEGORY_TITLES = {
+    components: "Components",
+    hooks: "Hooks",
+    services: "Services",
+    screens: "Screens",
+    themes: "Themes",
+};
 // List all available examples with enhanced error handling
 function listAvailableExamples() {
     const examples = {
@@ -198,26 +399,10 @@ function listAvailableExamples() {
             { key: "screens", dir: "screens" },
             { key: "themes", dir: "theme" }
         ];
-        const extensions = ['.js', '.jsx', '.ts', '.tsx'];
         for (const category of categories) {
-            const dirPath = path.join(CODE_EXAMPLES_DIR, "react-native", category.dir);
-            logDebug(`Scanning directory: ${dirPath}`);
-            if (fs.existsSync(dirPath)) {
-                for (const ext of extensions) {
-                    const files = glob.sync(`${dirPath}/**/*${ext}`);
-                    for (const filePath of files) {
-                        const fileName = path.basename(filePath);
-                        const fileNameNoExt = path.basename(fileName, path.extname(fileName));
-                        if (!examples[category.key].includes(fileNameNoExt)) {
-                            examples[category.key].push(fileNameNoExt);
-                        }
-                    }
-                }
-                logDebug(`Found ${examples[category.key].length} examples in ${category.key}`);
-            }
-            else {
-                logError(`Directory does not exist: ${dirPath}`);
-            }
+            const index = getExampleIndex(category.dir);
+            examples[category.key] = Object.values(index).map(entry => entry.name);
+            logDebug(`Found ${examples[category.key].length} examples in ${category.key}`);
         }
         return examples;
     }
@@ -227,264 +412,46 @@ function listAvailableExamples() {
     }
 }
 // Register tools optimized for VSCode GitHub Copilot
-// 1. Get project structure
-server.tool("get_project_structure", "Retrieve React Native project structure standards and best practices for organizing files and directories", {
-    format: z.enum(["markdown", "json"]).optional().describe("Output format - markdown (default) or json"),
-}, async ({ format = "markdown" }) => {
-    logInfo("Getting project structure standards");
-    const result = getStandardContent("standards", "project_structure");
-    if (result.error) {
-        logError("Failed to get project structure standards:", result.error);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error: ${result.error}`,
-                }],
-            isError: true,
-        };
-    }
-    return {
-        content: [{
-                type: "text",
-                text: result.content ?? "No content available",
-            }],
-    };
-});
-// 2. Get API communication standards
-server.tool("get_api_communication", "Retrieve API communication standards and patterns for React Native applications, including HTTP requests, error handling, and data management", {
-    format: z.enum(["markdown", "json"]).optional().describe("Output format - markdown (default) or json"),
-}, async ({ format = "markdown" }) => {
-    logInfo("Getting API communication standards");
-    const result = getStandardContent("standards", "api_communication");
-    if (result.error) {
-        logError("Failed to get API communication standards:", result.error);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error: ${result.error}`,
-                }],
-            isError: true,
-        };
-    }
-    return {
-        content: [{
-                type: "text",
-                text: result.content ?? "No content available",
-            }],
-    };
-});
-// 3. Get component design standards
-server.tool("get_component_design", "Retrieve component design standards and patterns for React Native development, including styling, props, and composition patterns", {
-    format: z.enum(["markdown", "json"]).optional().describe("Output format - markdown (default) or json"),
-}, async ({ format = "markdown" }) => {
-    logInfo("Getting component design standards");
-    const result = getStandardContent("standards", "component_design");
-    if (result.error) {
-        logError("Failed to get component design standards:", result.error);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error: ${result.error}`,
-                }],
-            isError: true,
-        };
-    }
-    return {
-        content: [{
-                type: "text",
-                text: result.content ?? "No content available",
-            }],
-    };
-});
-// 4. Get state management standards
-server.tool("get_state_management", "Retrieve state management standards and patterns for React Native applications, including Redux, Context API, and local state management", {
-    format: z.enum(["markdown", "json"]).optional().describe("Output format - markdown (default) or json"),
-}, async ({ format = "markdown" }) => {
-    logInfo("Getting state management standards");
-    const result = getStandardContent("standards", "state_management");
-    if (result.error) {
-        logError("Failed to get state management standards:", result.error);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error: ${result.error}`,
-                }],
-            isError: true,
-        };
-    }
-    return {
-        content: [{
-                type: "text",
-                text: result.content ?? "No content available",
-            }],
-    };
-});
-// 5. Get component example
-server.tool("get_component_example", "Retrieve a React Native component example with complete implementation including TypeScript types, styling, and usage patterns", {
-    component_name: z.string().describe("Name of the React Native component (e.g., 'Button', 'Modal', 'LoadingSpinner')"),
-    include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
-    include_types: z.boolean().optional().describe("Include TypeScript type definitions (default: true)"),
-}, async ({ component_name, include_usage = true, include_types = true }) => {
-    if (!component_name) {
-        logError("Component name not provided");
-        return {
-            content: [{
-                    type: "text",
-                    text: "Error: Component name is required",
-                }],
-            isError: true,
-        };
-    }
-    logInfo(`Getting component example: ${component_name}`);
-    try {
-        // First try exact match
-        const result = getExampleContent("components", component_name);
-        if (result.error) {
-            // Try to find by fuzzy match
-            const componentsDir = path.join(CODE_EXAMPLES_DIR, "react-native", "components");
-            const closestMatch = findClosestMatch(componentsDir, component_name);
-            if (closestMatch) {
-                logInfo(`Found closest match: ${closestMatch} for ${component_name}`);
-                const fuzzyResult = getExampleContent("components", closestMatch);
-                if (fuzzyResult.content) {
-                    return {
-                        content: [{
-                                type: "text",
-                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content[0]}`,
-                            }],
-                    };
-                }
-            }
-            logError(`Component not found: ${component_name}`);
-            return {
-                content: [{
-                        type: "text",
-                        text: `Component '${component_name}' not found. Use 'list_available_examples' to see available components.`,
-                    }],
-                isError: true,
-            };
-        }
-        return {
-            content: [{
-                    type: "text",
-                    text: `// Component: ${component_name}\n// File: ${result.path}\n\n${result.content?.[0] ?? "No content available"}`,
-                }],
-        };
-    }
-    catch (err) {
-        logError(`Error getting component example ${component_name}:`, err);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error retrieving component example: ${err}`,
-                }],
-            isError: true,
-        };
-    }
-});
-// 6. Get hook example
-server.tool("get_hook_example", "Retrieve a React Native custom hook example with complete implementation including TypeScript types, dependencies, and usage patterns", {
-    hook_name: z.string().describe("Name of the React Native hook (e.g., 'useAppUpdate', 'useForm', 'useApiCall')"),
-    include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
-}, async ({ hook_name, include_usage = true }) => {
-    if (!hook_name) {
-        logError("Hook name not provided");
-        return {
-            content: [{
-                    type: "text",
-                    text: "Error: Hook name is required",
-                }],
-            isError: true,
-        };
-    }
-    logInfo(`Getting hook example: ${hook_name}`);
-    try {
-        // First try exact match
-        const result = getExampleContent("hooks", hook_name);
-        if (result.error) {
-            // Try to find by fuzzy match
-            const hooksDir = path.join(CODE_EXAMPLES_DIR, "react-native", "hooks");
-            const closestMatch = findClosestMatch(hooksDir, hook_name);
-            if (closestMatch) {
-                logInfo(`Found closest match: ${closestMatch} for ${hook_name}`);
-                const fuzzyResult = getExampleContent("hooks", closestMatch);
-                if (fuzzyResult.content) {
-                    return {
-                        content: [{
-                                type: "text",
-                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content[0]}`,
-                            }],
-                    };
-                }
-            }
-            logError(`Hook not found: ${hook_name}`);
-            return {
-                content: [{
-                        type: "text",
-                        text: `Hook '${hook_name}' not found. Use 'list_available_examples' to see available hooks.`,
-                    }],
-                isError: true,
-            };
-        }
-        return {
-            content: [{
-                    type: "text",
-                    text: `// Hook: ${hook_name}\n// File: ${result.path}\n\n${result.content?.[0] ?? "No content available"}`,
-                }],
-        };
-    }
-    catch (err) {
-        logError(`Error getting hook example ${hook_name}:`, err);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error retrieving hook example: ${err}`,
-                }],
-            isError: true,
-        };
-    }
-});
-// 7. Get service example
-// 7. Get service example
-server.tool("get_service_example", "Retrieve a React Native service example with complete implementation including API calls, error handling, and data processing patterns", {
-    service_name: z.string().describe("Name of the React Native service (e.g., 'apiService', 'authService', 'storageService')"),
-    include_types: z.boolean().optional().describe("Include TypeScript type definitions (default: true)"),
-}, async ({ service_name, include_types = true }) => {
-    if (!service_name) {
-        logError("Service name not provided");
-        return {
-            content: [{
-                    type: "text",
-                    text: "Error: Service name is required",
-                }],
-            isError: true,
-        };
-    }
-    logInfo(`Getting service example: ${service_name}`);
-    try {
-        // First try exact match
-        const result = getExampleContent("services", service_name);
+// Standards served by table-driven tool and resource registration
+const STANDARDS = [
+    {
+        id: "project_structure",
+        label: "project structure",
+        toolName: "get_project_structure",
+        description: "Retrieve React Native project structure standards and best practices for organizing files and directories",
+    },
+    {
+        id: "api_communication",
+        label: "API communication",
+        toolName: "get_api_communication",
+        description: "Retrieve API communication standards and patterns for React Native applications, including HTTP requests, error handling, and data management",
+    },
+    {
+        id: "component_design",
+        label: "component design",
+        toolName: "get_component_design",
+        description: "Retrieve component design standards and patterns for React Native development, including styling, props, and composition patterns",
+    },
+    {
+        id: "state_management",
+        label: "state management",
+        toolName: "get_state_management",
+        description: "Retrieve state management standards and patterns for React Native applications, including Redux, Context API, and local state management",
+    },
+];
+// 1-4. Get standards (project structure, API communication, component design, state management)
+for (const standard of STANDARDS) {
+    server.tool(standard.toolName, standard.description, {
+        format: z.enum(["markdown", "json"]).optional().describe("Output format - markdown (default) or json"),
+    }, async ({ format = "markdown" }) => {
+        logInfo(`Getting ${standard.label} standards`);
+        const result = getStandardContent("standards", standard.id);
         if (result.error) {
-            // Try to find by fuzzy match
-            const servicesDir = path.join(CODE_EXAMPLES_DIR, "react-native", "services");
-            const closestMatch = findClosestMatch(servicesDir, service_name);
-            if (closestMatch) {
-                logInfo(`Found closest match: ${closestMatch} for ${service_name}`);
-                const fuzzyResult = getExampleContent("services", closestMatch);
-                if (fuzzyResult.content) {
-                    return {
-                        content: [{
-                                type: "text",
-                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content[0]}`,
-                            }],
-                    };
-                }
-            }
-            logError(`Service not found: ${service_name}`);
+            logError(`Failed to get ${standard.label} standards:`, result.error);
             return {
                 content: [{
                         type: "text",
-                        text: `Service '${service_name}' not found. Use 'list_available_examples' to see available services.`,
+                        text: `Error: ${result.error}`,
                     }],
                 isError: true,
             };
@@ -492,124 +459,117 @@ server.tool("get_service_example", "Retrieve a React Native service example with
         return {
             content: [{
                     type: "text",
-                    text: `// Service: ${service_name}\n// File: ${result.path}\n\n${result.content?.[0] ?? "No content available"}`,
+                    text: result.content ?? "No content available",
                 }],
         };
-    }
-    catch (err) {
-        logError(`Error getting service example ${service_name}:`, err);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error retrieving service example: ${err}`,
-                }],
-            isError: true,
-        };
-    }
-});
-// 8. Get screen example
-server.tool("get_screen_example", "Retrieve a React Native screen example with complete implementation including navigation, state management, and UI components", {
-    screen_name: z.string().describe("Name of the React Native screen (e.g., 'LoginScreen', 'HomeScreen', 'ProfileScreen')"),
-    include_navigation: z.boolean().optional().describe("Include navigation setup (default: true)"),
-    include_styles: z.boolean().optional().describe("Include styling examples (default: true)"),
-}, async ({ screen_name, include_navigation = true, include_styles = true }) => {
-    if (!screen_name) {
-        logError("Screen name not provided");
-        return {
-            content: [{
-                    type: "text",
-                    text: "Error: Screen name is required",
-                }],
-            isError: true,
-        };
-    }
-    logInfo(`Getting screen example: ${screen_name}`);
-    try {
-        // First try exact match
-        const result = getExampleContent("screens", screen_name);
-        if (result.error) {
-            // Try to find by fuzzy match
-            const screensDir = path.join(CODE_EXAMPLES_DIR, "react-native", "screens");
-            const closestMatch = findClosestMatch(screensDir, screen_name);
-            if (closestMatch) {
-                logInfo(`Found closest match: ${closestMatch} for ${screen_name}`);
-                const fuzzyResult = getExampleContent("screens", closestMatch);
-                if (fuzzyResult.content) {
-                    return {
-                        content: [{
-                                type: "text",
-                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content[0]}`,
-                            }],
-                    };
-                }
-            }
-            logError(`Screen not found: ${screen_name}`);
+    });
+}
+// 5-9. Get example tools (components, hooks, services, screens, themes).
+// The five tools share one handler shape, so they are registered from a
+// spec table; only the schema, category, and wording differ.
+const EXAMPLE_TOOLS = [
+    {
+        name: "get_component_example",
+        description: "Retrieve a React Native component example with complete implementation including TypeScript types, styling, and usage patterns",
+        categoryDir: "components",
+        label: "Component",
+        listHint: "components",
+        argName: "component_name",
+        schema: {
+            component_name: z.string().describe("Name of the React Native component (e.g., 'Button', 'Modal', 'LoadingSpinner')"),
+            include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
+            include_types: z.boolean().optional().describe("Include TypeScript type definitions (default: true)"),
+        },
+    },
+    {
+        name: "get_hook_example",
+        description: "Retrieve a React Native custom hook example with complete implementation including TypeScript types, dependencies, and usage patterns",
+        categoryDir: "hooks",
+        label: "Hook",
+        listHint: "hooks",
+        argName: "hook_name",
+        schema: {
+            hook_name: z.string().describe("Name of the React Native hook (e.g., 'useAppUpdate', 'useForm', 'useApiCall')"),
+            include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
+        },
+    },
+    {
+        name: "get_service_example",
+        description: "Retrieve a React Native service example with complete implementation including API calls, error handling, and data processing patterns",
+        categoryDir: "services",
+        label: "Service",
+        listHint: "services",
+        argName: "service_name",
+        schema: {
+            service_name: z.string().describe("Name of the React Native service (e.g., 'apiService', 'authService', 'storageService')"),
+            include_types: z.boolean().optional().describe("Include TypeScript type definitions (default: true)"),
+        },
+    },
+    {
+        name: "get_screen_example",
+        description: "Retrieve a React Native screen example with complete implementation including navigation, state management, and UI components",
+        categoryDir: "screens",
+        label: "Screen",
+        listHint: "screens",
+        argName: "screen_name",
+        schema: {
+            screen_name: z.string().describe("Name of the React Native screen (e.g., 'LoginScreen', 'HomeScreen', 'ProfileScreen')"),
+            include_navigation: z.boolean().optional().describe("Include navigation setup (default: true)"),
+            include_styles: z.boolean().optional().describe("Include styling examples (default: true)"),
+        },
+    },
+    {
+        name: "get_theme_example",
+        description: "Retrieve React Native theme and styling examples including colors, typography, spacing, and component styles",
+        categoryDir: "theme",
+        label: "Theme",
+        listHint: "themes",
+        argName: "theme_name",
+        schema: {
+            theme_name: z.string().describe("Name of the theme or style component (e.g., 'colors', 'typography', 'theme')"),
+            include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
+        },
+    },
+];
+for (const spec of EXAMPLE_TOOLS) {
+    server.tool(spec.name, spec.description, spec.schema, async (args) => {
+        const exampleName = args[spec.argName];
+        if (!exampleName) {
+            logError(`${spec.label} name not provided`);
             return {
                 content: [{
                         type: "text",
-                        text: `Screen '${screen_name}' not found. Use 'list_available_examples' to see available screens.`,
+                        text: `Error: ${spec.label} name is required`,
                     }],
                 isError: true,
             };
         }
-        return {
-            content: [{
-                    type: "text",
-                    text: `// Screen: ${screen_name}\n// File: ${result.path}\n\n${result.content?.[0] ?? "No content available"}`,
-                }],
-        };
-    }
-    catch (err) {
-        logError(`Error getting screen example ${screen_name}:`, err);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error retrieving screen example: ${err}`,
-                }],
-            isError: true,
-        };
-    }
-});
-// 9. Get theme example
-server.tool("get_theme_example", "Retrieve React Native theme and styling examples including colors, typography, spacing, and component styles", {
-    theme_name: z.string().describe("Name of the theme or style component (e.g., 'colors', 'typography', 'theme')"),
-    include_usage: z.boolean().optional().describe("Include usage examples (default: true)"),
-}, async ({ theme_name, include_usage = true }) => {
-    if (!theme_name) {
-        logError("Theme name not provided");
-        return {
-            content: [{
-                    type: "text",
-                    text: "Error: Theme name is required",
-                }],
-            isError: true,
-        };
-    }
-    logInfo(`Getting theme example: ${theme_name}`);
-    try {
-        // First try exact match
-        const result = getExampleContent("theme", theme_name);
+        logInfo(`Getting ${spec.label.toLowerCase()} example: ${exampleName}`);
+        // getExampleContent reports failures through its error field, so
+        // branch on the result instead of wrapping it in a dead try/catch
+        const result = getExampleContent(spec.categoryDir, exampleName);
         if (result.error) {
             // Try to find by fuzzy match
-            const themesDir = path.join(CODE_EXAMPLES_DIR, "react-native", "theme");
-            const closestMatch = findClosestMatch(themesDir, theme_name);
+            const closestMatch = findClosestMatch(spec.categoryDir, exampleName);
             if (closestMatch) {
-                logInfo(`Found closest match: ${closestMatch} for ${theme_name}`);
-                const fuzzyResult = getExampleContent("theme", closestMatch);
-                if (fuzzyResult.content) {
+                logInfo(`Found closest match: ${closestMatch} for ${exampleName}`);
+                const fuzzyResult = getExampleContent(spec.categoryDir, closestMatch);
+                // Check for the error field rather than content truthiness so
+                // an empty example file is still served
+                if (!fuzzyResult.error) {
                     return {
                         content: [{
                                 type: "text",
-                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content[0]}`,
+                                text: `// Found closest match: ${closestMatch}\n// File: ${fuzzyResult.path}\n\n${fuzzyResult.content}`,
                             }],
                     };
                 }
             }
-            logError(`Theme not found: ${theme_name}`);
+            logError(`${spec.label} not found: ${exampleName}`);
             return {
                 content: [{
                         type: "text",
-                        text: `Theme '${theme_name}' not found. Use 'list_available_examples' to see available themes.`,
+                        text: `${spec.label} '${exampleName}' not found. Use 'list_available_examples' to see available ${spec.listHint}.`,
                     }],
                 isError: true,
             };
@@ -617,21 +577,11 @@ server.tool("get_theme_example", "Retrieve React Native theme and styling exampl
         return {
             content: [{
                     type: "text",
-                    text: `// Theme: ${theme_name}\n// File: ${result.path}\n\n${result.content?.[0] ?? "No content available"}`,
-                }],
-        };
-    }
-    catch (err) {
-        logError(`Error getting theme example ${theme_name}:`, err);
-        return {
-            content: [{
-                    type: "text",
-                    text: `Error retrieving theme example: ${err}`,
+                    text: `// ${spec.label}: ${exampleName}\n// File: ${result.path}\n\n${result.content ?? "No content available"}`,
                 }],
-            isError: true,
         };
-    }
-});
+    });
+}
 // 10. List available examples
 server.tool("list_available_examples", "List all available code examples organized by category (components, hooks, services, screens, themes) for React Native development", {
     category: z.enum(["components", "hooks", "services", "screens", "themes", "all"]).optional().describe("Filter by category, or 'all' for everything (default)"),
@@ -643,7 +593,7 @@ server.tool("list_available_examples", "List all available code examples organiz
         if (category !== "all" && examples[category]) {
             const filtered = { [category]: examples[category] };
             if (format === "markdown") {
-                const markdown = `# Available ${category.charAt(0).toUpperCase() + category.slice(1)} Examples\n\n${filtered[category].map(item => `- ${item}`).join('\n')}`;
+                const markdown = `# Available ${CATEGORY_TITLES[category] ?? category} Examples\n\n${filtered[category].map(item => `- ${item}`).join('\n')}`;
                 return {
                     content: [{
                             type: "text",
@@ -661,7 +611,7 @@ server.tool("list_available_examples", "List all available code examples organiz
         if (format === "markdown") {
             let markdown = "# Available React Native Examples\n\n";
             for (const [cat, items] of Object.entries(examples)) {
-                markdown += `## ${cat.charAt(0).toUpperCase() + cat.slice(1)} (${items.length})\n`;
+                markdown += `## ${CATEGORY_TITLES[cat] ?? cat} (${items.length})\n`;
                 markdown += items.map(item => `- ${item}`).join('\n') + '\n\n';
             }
             return {
@@ -690,46 +640,18 @@ server.tool("list_available_examples", "List all available code examples organiz
     }
 });
 // Add resource discovery for VSCode integration
-server.resource("standards/project_structure", "React Native project structure standards", async () => {
-    const result = getStandardContent("standards", "project_structure");
-    return {
-        contents: [{
-                uri: "standards://project_structure",
-                mimeType: "text/markdown",
-                text: result.content ?? result.error ?? "Content not available",
-            }],
-    };
-});
-server.resource("standards/api_communication", "React Native API communication standards", async () => {
-    const result = getStandardContent("standards", "api_communication");
-    return {
-        contents: [{
-                uri: "standards://api_communication",
-                mimeType: "text/markdown",
-                text: result.content ?? result.error ?? "Content not available",
-            }],
-    };
-});
-server.resource("standards/component_design", "React Native component design standards", async () => {
-    const result = getStandardContent("standards", "component_design");
-    return {
-        contents: [{
-                uri: "standards://component_design",
-                mimeType: "text/markdown",
-                text: result.content ?? result.error ?? "Content not available",
-            }],
-    };
-});
-server.resource("standards/state_management", "React Native state management standards", async () => {
-    const result = getStandardContent("standards", "state_management");
-    return {
-        contents: [{
-                uri: "standards://state_management",
-                mimeType: "text/markdown",
-                text: result.content ?? result.error ?? "Content not available",
-            }],
-    };
-});
+for (const standard of STANDARDS) {
+    server.resource(`standards/${standard.id}`, `React Native ${standard.label} standards`, async () => {
+        const result = getStandardContent("standards", standard.id);
+        return {
+            contents: [{
+                    uri: `standards://${standard.id}`,
+                    mimeType: "text/markdown",
+                    text: result.content ?? result.error ?? "Content not available",
+                }],
+        };
+    });
+}
 // Health check and server validation
 function validateServerSetup() {
     const errors = [];
@@ -776,6 +698,21 @@ async function main() {
             // HTTP JSON-RPC transport (for VSCode GitHub Copilot integration)
             const { createServer } = await import('http');
             const { parse } = await import('url');
+            // The status payload never changes, so serialize it once at startup
+            const statusBody = JSON.stringify({
+                status: 'running',
+                server: 'bluestoneapps-copilot',
+                version: '1.0.0',
+                port: SERVER_PORT,
+                host: SERVER_HOST,
+                transport: 'http-jsonrpc',
+                message: 'MCP Server running with HTTP JSON-RPC transport. POST JSON-RPC requests to /',
+                capabilities: {
+                    tools: true,
+                    resources: true,
+                    logging: true
+                }
+            });
             const httpServer = createServer(async (req, res) => {
                 const parsedUrl = parse(req.url || '', true);
                 const pathname = parsedUrl.pathname;
@@ -789,17 +726,19 @@ async function main() {
                     return;
                 }
                 if (pathname === '/' && req.method === 'POST') {
-                    // Handle JSON-RPC requests with proper MCP transport
-                    let body = '';
-                    req.on('data', chunk => body += chunk);
+                    // Handle JSON-RPC requests with proper MCP transport.
+                    // Collect raw chunks and decode once at the end instead of
+                    // re-concatenating a string per chunk.
+                    const chunks = [];
+                    req.on('data', chunk => chunks.push(chunk));
                     req.on('end', async () => {
                         try {
+                            const body = Buffer.concat(chunks).toString('utf8');
                             const jsonrpcRequest = JSON.parse(body);
-                            logInfo(`Received JSON-RPC request: ${jsonrpcRequest.method}`);
+                            logDebug(`Received JSON-RPC request: ${jsonrpcRequest.method}`);
                             // Create HTTP transport for this request
                             const transport = new HTTPTransport();
                             transport.setResponse(res);
-                            transport.setRequest(req);
                             // Connect server with the transport
                             await server.connect(transport);
                             // Send the request to the server
@@ -836,20 +775,7 @@ async function main() {
                 else if (pathname === '/status' || (pathname === '/' && req.method === 'GET')) {
                     // Status endpoint
                     res.writeHead(200, { 'Content-Type': 'application/json' });
-                    res.end(JSON.stringify({
-                        status: 'running',
-                        server: 'bluestoneapps-copilot',
-                        version: '1.0.0',
-                        port: SERVER_PORT,
-                        host: SERVER_HOST,
-                        transport: 'http-jsonrpc',
-                        message: 'MCP Server running with HTTP JSON-RPC transport. POST JSON-RPC requests to /',
-                        capabilities: {
-                            tools: true,
-                            resources: true,
-                            logging: true
-                        }
-                    }));
+                    res.end(statusBody);
                 }
                 else {
                     res.writeHead(404, { 'Content-Type': 'text/plain' });